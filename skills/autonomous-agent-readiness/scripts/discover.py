@@ -10,42 +10,157 @@ Usage:
     python discover.py .  # current directory
 """
 
+import fnmatch
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-
-def find_files(root: Path, patterns: list[str]) -> list[str]:
-    """Find files matching any of the given patterns."""
-    found = []
-    for pattern in patterns:
-        found.extend(str(p.relative_to(root)) for p in root.rglob(pattern))
-    return sorted(set(found))
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CI_PATTERNS = [
+    '.github/workflows/*.yml',
+    '.github/workflows/*.yaml',
+    '.gitlab-ci.yml',
+    'Jenkinsfile',
+    '.circleci/config.yml',
+    'azure-pipelines.yml',
+    '.travis.yml',
+    'bitbucket-pipelines.yml',
+]
+
+DB_PATTERNS = [
+    'migrations/*',
+    'db/migrate/*',
+    'alembic/*',
+    'prisma/migrations/*',
+    'seeds/*',
+    'fixtures/*',
+    '**/seeds.sql',
+    '**/seed.sql',
+]
+
+K8S_PATTERNS = [
+    'k8s/*.yaml',
+    'k8s/*.yml',
+    'kubernetes/*.yaml',
+    'kubernetes/*.yml',
+    'helm/**/values.yaml',
+    'deploy/*.yaml',
+    'deploy/*.yml',
+]
+
+# Dependency, build, and VCS directories never hold the files we look for
+PRUNE_DIRS = {'.git', 'node_modules', '.venv', 'venv', '__pycache__', 'target', 'build', 'dist', '.next', '.cache'}
+
+COMPOSE_DATABASES = ['postgres', 'mysql', 'mongo', 'redis', 'sqlite']
+# No trailing \b: 'postgresql' and 'mongodb' images should still count
+COMPOSE_DB_RE = re.compile(rb'|'.join(db.encode() for db in COMPOSE_DATABASES), re.IGNORECASE)
+
+
+def compile_pattern(pattern: str) -> list[re.Pattern[str] | None]:
+    """Compile a recursive glob into per-segment regexes (None means '**').
+
+    Like rglob, the pattern matches at any depth: 'k8s/*.yaml' also finds
+    apps/api/k8s/c.yaml.
+    """
+    segments: list[re.Pattern[str] | None] = [None]
+    for part in pattern.split('/'):
+        segments.append(None if part == '**' else re.compile(fnmatch.translate(part)))
+    return segments
+
+
+def match_parts(parts: list[str], segments: list[re.Pattern[str] | None]) -> bool:
+    """Check whether path segments match a compiled pattern."""
+    if not segments:
+        return not parts
+    head = segments[0]
+    if head is None:
+        return any(match_parts(parts[i:], segments[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and head.match(parts[0]) is not None and match_parts(parts[1:], segments[1:])
+
+
+def walk_tree(top: str, top_parts: list[str], compiled: list) -> list[tuple[str, str]]:
+    """Walk one subtree, pruning PRUNE_DIRS, and return (pattern, relative path) pairs."""
+    matches = []
+    parts_by_dir = {top: top_parts}
+    for dir_path, dirnames, filenames in os.walk(top, topdown=True, followlinks=False):
+        dir_parts = parts_by_dir.pop(dir_path)
+        for name in chain(dirnames, filenames):
+            parts = dir_parts + [name]
+            for segments, pattern in compiled:
+                if match_parts(parts, segments):
+                    matches.append((pattern, '/'.join(parts)))
+        dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS]
+        for d in dirnames:
+            parts_by_dir[os.path.join(dir_path, d)] = dir_parts + [d]
+    return matches
+
+
+def find_files(patterns: list[str], root_entries: dict[str, os.DirEntry]) -> dict[str, list[str]]:
+    """Find paths matching each pattern (like rglob), walking top-level subtrees in parallel."""
+    compiled = [(compile_pattern(p), p) for p in patterns]
+    found: dict[str, list[str]] = {p: [] for p in patterns}
+
+    subdirs = []
+    for entry in root_entries.values():
+        for segments, pattern in compiled:
+            if match_parts([entry.name], segments):
+                found[pattern].append(entry.name)
+        if entry.is_dir(follow_symlinks=False) and entry.name not in PRUNE_DIRS:
+            subdirs.append(entry)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(lambda e: walk_tree(e.path, [e.name], compiled), subdirs)
+        for matches in results:
+            for pattern, path in matches:
+                found[pattern].append(path)
+
+    return found
+
+
+def collect_matches(found: dict[str, list[str]], patterns: list[str]) -> list[str]:
+    """Merge the matches for a group of patterns into a sorted list."""
+    return sorted({path for p in patterns for path in found[p]})
+
+
+def scan_dir(path: Path) -> dict[str, os.DirEntry]:
+    """List a directory once, mapping entry names to their DirEntry."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
 
 
-def check_file_exists(root: Path, paths: list[str]) -> dict[str, bool]:
-    """Check which files exist."""
-    return {p: (root / p).exists() for p in paths}
+def check_file_exists(root: Path, paths: list[str], dir_cache: dict[str, dict[str, os.DirEntry]]) -> dict[str, bool]:
+    """Check which files exist, listing each parent directory at most once."""
+    result = {}
+    for p in paths:
+        parent, _, name = p.rpartition('/')
+        if parent not in dir_cache:
+            dir_cache[parent] = scan_dir(root / parent)
+        result[p] = name in dir_cache[parent]
+    return result
 
 
-def read_file_preview(path: Path, max_lines: int = 50) -> str | None:
-    """Read first N lines of a file, return None if not readable."""
+def read_file_preview(path: Path, max_bytes: int = 16384) -> bytes | None:
+    """Read the first max_bytes of a file, return None if not readable."""
     try:
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = []
-            for i, line in enumerate(f):
-                if i >= max_lines:
-                    lines.append(f"... (truncated at {max_lines} lines)")
-                    break
-                lines.append(line.rstrip())
-            return '\n'.join(lines)
+        with open(path, 'rb') as f:
+            return f.read(max_bytes)
     except Exception:
         return None
 
 
-def detect_stack(root: Path) -> list[str]:
-    """Detect the project's technology stack."""
+def detect_stack(root_entries: dict[str, os.DirEntry]) -> list[str]:
+    """Detect the project's technology stack from the root directory listing."""
     stack = []
 
     indicators = {
@@ -62,10 +177,10 @@ def detect_stack(root: Path) -> list[str]:
     for tech, files in indicators.items():
         for f in files:
             if '*' in f:
-                if list(root.glob(f)):
+                if any(fnmatch.fnmatchcase(name, f) for name in root_entries):
                     stack.append(tech)
                     break
-            elif (root / f).exists():
+            elif f in root_entries:
                 stack.append(tech)
                 break
 
@@ -79,12 +194,19 @@ def discover_project(project_path: str) -> dict:
     if not root.is_dir():
         return {"error": f"Not a directory: {project_path}"}
 
+    # Directory listings keyed by relative path ('' is the project root)
+    root_entries = scan_dir(root)
+    dir_cache = {'': root_entries}
+
     findings = {
         "project_root": str(root),
         "project_name": root.name,
-        "stack": detect_stack(root),
+        "stack": detect_stack(root_entries),
     }
 
+    # One tree walk shared by the CI/CD, database, and k8s sections
+    found = find_files(CI_PATTERNS + DB_PATTERNS + K8S_PATTERNS, root_entries)
+
     # Containerization
     container_files = check_file_exists(root, [
         'Dockerfile',
@@ -92,7 +214,7 @@ def discover_project(project_path: str) -> dict:
         'docker-compose.yaml',
         '.devcontainer/devcontainer.json',
         'devcontainer.json',
-    ])
+    ], dir_cache)
     findings["containerization"] = {
         "files": {k: v for k, v in container_files.items() if v},
         "has_dockerfile": container_files.get('Dockerfile', False),
@@ -101,16 +223,7 @@ def discover_project(project_path: str) -> dict:
     }
 
     # CI/CD
-    ci_files = find_files(root, [
-        '.github/workflows/*.yml',
-        '.github/workflows/*.yaml',
-        '.gitlab-ci.yml',
-        'Jenkinsfile',
-        '.circleci/config.yml',
-        'azure-pipelines.yml',
-        '.travis.yml',
-        'bitbucket-pipelines.yml',
-    ])
+    ci_files = collect_matches(found, CI_PATTERNS)
     findings["ci_cd"] = {
         "files": ci_files,
         "has_ci": len(ci_files) > 0,
@@ -124,16 +237,7 @@ def discover_project(project_path: str) -> dict:
         findings["ci_cd"]["platforms"].append("jenkins")
 
     # Database setup
-    db_indicators = find_files(root, [
-        'migrations/*',
-        'db/migrate/*',
-        'alembic/*',
-        'prisma/migrations/*',
-        'seeds/*',
-        'fixtures/*',
-        '**/seeds.sql',
-        '**/seed.sql',
-    ])
+    db_indicators = collect_matches(found, DB_PATTERNS)
     findings["database"] = {
         "migration_files": [f for f in db_indicators if 'migrat' in f.lower()],
         "seed_files": [f for f in db_indicators if 'seed' in f.lower() or 'fixture' in f.lower()],
@@ -142,17 +246,17 @@ def discover_project(project_path: str) -> dict:
     }
 
     # Check for database in docker-compose
-    compose_path = root / 'docker-compose.yml'
-    if not compose_path.exists():
-        compose_path = root / 'docker-compose.yaml'
-    if compose_path.exists():
-        compose_content = read_file_preview(compose_path, 200)
+    if 'docker-compose.yml' in root_entries:
+        compose_name = 'docker-compose.yml'
+    elif 'docker-compose.yaml' in root_entries:
+        compose_name = 'docker-compose.yaml'
+    else:
+        compose_name = None
+    if compose_name:
+        compose_content = read_file_preview(root / compose_name)
         if compose_content:
-            db_services = []
-            for db in ['postgres', 'mysql', 'mongo', 'redis', 'sqlite']:
-                if db in compose_content.lower():
-                    db_services.append(db)
-            findings["database"]["compose_services"] = db_services
+            seen = {m.group(0).decode().lower() for m in COMPOSE_DB_RE.finditer(compose_content)}
+            findings["database"]["compose_services"] = [db for db in COMPOSE_DATABASES if db in seen]
 
     # Environment management
     env_files = check_file_exists(root, [
@@ -161,7 +265,7 @@ def discover_project(project_path: str) -> dict:
         '.env.template',
         'env.example',
         '.envrc',
-    ])
+    ], dir_cache)
     findings["environment"] = {
         "example_env": {k: v for k, v in env_files.items() if v},
         "has_env_example": any(env_files.values()),
@@ -178,7 +282,7 @@ def discover_project(project_path: str) -> dict:
         'go.sum',
         'Cargo.lock',
         'composer.lock',
-    ])
+    ], dir_cache)
     findings["dependencies"] = {
         "lockfiles": {k: v for k, v in lockfiles.items() if v},
         "has_lockfile": any(lockfiles.values()),
@@ -192,7 +296,7 @@ def discover_project(project_path: str) -> dict:
         '.ruby-version',
         '.tool-versions',
         '.sdkmanrc',
-    ])
+    ], dir_cache)
     findings["version_pinning"] = {
         "files": {k: v for k, v in version_files.items() if v},
         "has_version_pinning": any(version_files.values()),
@@ -201,7 +305,7 @@ def discover_project(project_path: str) -> dict:
     # Testing
     test_dirs = []
     for pattern in ['tests', 'test', '__tests__', 'spec', 'specs']:
-        if (root / pattern).is_dir():
+        if pattern in root_entries and root_entries[pattern].is_dir():
             test_dirs.append(pattern)
 
     test_configs = check_file_exists(root, [
@@ -213,7 +317,7 @@ def discover_project(project_path: str) -> dict:
         'vitest.config.js',
         '.rspec',
         'phpunit.xml',
-    ])
+    ], dir_cache)
 
     findings["testing"] = {
         "test_directories": test_dirs,
@@ -224,12 +328,12 @@ def discover_project(project_path: str) -> dict:
     # Scripts and CLI
     script_dirs = []
     for pattern in ['scripts', 'bin', 'tools']:
-        if (root / pattern).is_dir():
+        if pattern in root_entries and root_entries[pattern].is_dir():
             script_dirs.append(pattern)
 
-    has_makefile = (root / 'Makefile').exists()
-    has_taskfile = (root / 'Taskfile.yml').exists() or (root / 'Taskfile.yaml').exists()
-    has_justfile = (root / 'justfile').exists() or (root / 'Justfile').exists()
+    has_makefile = 'Makefile' in root_entries
+    has_taskfile = 'Taskfile.yml' in root_entries or 'Taskfile.yaml' in root_entries
+    has_justfile = 'justfile' in root_entries or 'Justfile' in root_entries
 
     findings["scripts"] = {
         "directories": script_dirs,
@@ -247,7 +351,7 @@ def discover_project(project_path: str) -> dict:
         'docs/README.md',
         'DEVELOPMENT.md',
         'SETUP.md',
-    ])
+    ], dir_cache)
     findings["documentation"] = {
         "files": {k: v for k, v in doc_files.items() if v},
         "has_readme": doc_files.get('README.md', False) or doc_files.get('README.rst', False),
@@ -255,15 +359,7 @@ def discover_project(project_path: str) -> dict:
     }
 
     # Resource limits (check for kubernetes/docker resource configs)
-    k8s_files = find_files(root, [
-        'k8s/*.yaml',
-        'k8s/*.yml',
-        'kubernetes/*.yaml',
-        'kubernetes/*.yml',
-        'helm/**/values.yaml',
-        'deploy/*.yaml',
-        'deploy/*.yml',
-    ])
+    k8s_files = collect_matches(found, K8S_PATTERNS)
     findings["resource_management"] = {
         "kubernetes_files": k8s_files,
         "has_k8s": len(k8s_files) > 0,
@@ -272,6 +368,16 @@ def discover_project(project_path: str) -> dict:
     return findings
 
 
+def write_json(data: dict) -> None:
+    """Write JSON to stdout without building an intermediate string."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: discover.py <project-path>", file=sys.stderr)
@@ -279,7 +385,7 @@ def main():
 
     project_path = sys.argv[1]
     findings = discover_project(project_path)
-    print(json.dumps(findings, indent=2))
+    write_json(findings)
 
 
 if __name__ == "__main__":
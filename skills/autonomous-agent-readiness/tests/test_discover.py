@@ -0,0 +1,73 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SKILL_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = SKILL_ROOT / "scripts" / "discover.py"
+
+spec = importlib.util.spec_from_file_location(SCRIPT.stem, SCRIPT)
+MODULE = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = MODULE
+spec.loader.exec_module(MODULE)
+
+
+def matches(pattern: str, path: str) -> bool:
+    return MODULE.match_parts(path.split("/"), MODULE.compile_pattern(pattern))
+
+
+class DiscoverPatternTests(unittest.TestCase):
+    def test_literal_prefix_matches_at_any_depth(self):
+        self.assertTrue(matches("k8s/*.yaml", "k8s/a.yaml"))
+        self.assertTrue(matches("k8s/*.yaml", "apps/api/k8s/c.yaml"))
+        self.assertFalse(matches("k8s/*.yaml", "k8s/sub/b.yaml"))
+        self.assertFalse(matches("k8s/*.yaml", "k8s/a.yml"))
+
+    def test_double_star_spans_directories(self):
+        self.assertTrue(matches("helm/**/values.yaml", "helm/values.yaml"))
+        self.assertTrue(matches("helm/**/values.yaml", "helm/chart/sub/values.yaml"))
+        self.assertTrue(matches("**/seeds.sql", "seeds.sql"))
+        self.assertTrue(matches("**/seeds.sql", "db/data/seeds.sql"))
+        self.assertFalse(matches("helm/**/values.yaml", "chart/values.yaml"))
+
+    def test_bare_name_matches_anywhere(self):
+        self.assertTrue(matches("Jenkinsfile", "Jenkinsfile"))
+        self.assertTrue(matches("Jenkinsfile", "ci/Jenkinsfile"))
+        self.assertFalse(matches("Jenkinsfile", "Jenkinsfile.bak"))
+
+    def test_find_files_agrees_with_rglob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel in [
+                "k8s/a.yaml",
+                "k8s/sub/b.yaml",
+                "apps/api/k8s/c.yaml",
+                "migrations/001.sql",
+                "migrations/v1/002.sql",
+                "src/seeds/s.sql",
+                "helm/chart/values.yaml",
+                "db/seed.sql",
+                ".github/workflows/ci.yml",
+            ]:
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_text("")
+
+            patterns = MODULE.CI_PATTERNS + MODULE.DB_PATTERNS + MODULE.K8S_PATTERNS
+            found = MODULE.find_files(patterns, MODULE.scan_dir(root))
+            for pattern in patterns:
+                expected = sorted(p.relative_to(root).as_posix() for p in root.rglob(pattern))
+                self.assertEqual(sorted(found[pattern]), expected, pattern)
+
+    def test_find_files_skips_pruned_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "node_modules" / "pkg" / "migrations").mkdir(parents=True)
+            (root / "node_modules" / "pkg" / "migrations" / "001.sql").write_text("")
+
+            found = MODULE.find_files(["migrations/*"], MODULE.scan_dir(root))
+            self.assertEqual(found["migrations/*"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
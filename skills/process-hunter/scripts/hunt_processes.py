@@ -16,9 +16,23 @@ import subprocess
 import re
 import json
 import argparse
+import heapq
+import os
+import sys
+import time
 from dataclasses import dataclass
 from typing import Literal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Process me know safe to bonk
 AUTO_KILL_PATTERNS = [
     # Next.js - these eat MANY fire
@@ -64,10 +78,30 @@ IGNORE_PATTERNS = [
     r"^securityd$",
 ]
 
+# One regex per pile. AUTO_KILL alternatives are anchored lookaheads so the
+# first pattern in list order wins, same as checking them one by one.
+IGNORE_RE = re.compile("|".join(f"(?:{p})" for p in IGNORE_PATTERNS), re.IGNORECASE)
+AUTO_KILL_RE = re.compile(
+    "|".join(f"(?=(?s:.*?)(?P<g{i}>{p}))" for i, (p, _) in enumerate(AUTO_KILL_PATTERNS)),
+    re.IGNORECASE,
+)
+AUTO_KILL_DESCS = {f"g{i}": desc for i, (_, desc) in enumerate(AUTO_KILL_PATTERNS)}
+
+# Me only keep this much of command. Enough for sniff, not whole scroll.
+COMMAND_SCAN_CHARS = 200
+# How long me watch creatures between two peeks on Mac when counting fire.
+CPU_SAMPLE_SECONDS = 0.2
+
+# One ps line: pid, pcpu, rss, comm, args. Regex cut the columns, not Python.
+PS_LINE_RE = re.compile(rb"\s*(\d+)\s+(\d+(?:\.\d*)?)\s+(\d+)\s+(\S+)\s+(.*)")
+
+# /proc cmdline split args with NUL; ps show them (and newline) as space
+CMDLINE_SPACES = bytes.maketrans(b"\0\n\t", b"   ")
+
 Category = Literal["AUTO_KILL", "ASK", "IGNORE"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     pid: int
     name: str
@@ -78,37 +112,176 @@ class ProcessInfo:
     reason: str
 
 
-def get_processes(cpu_threshold: float, mem_threshold: float) -> list[ProcessInfo]:
-    """Me look at all process. Find greedy ones."""
-    cmd = ["ps", "-eo", "pid,pcpu,rss,comm,args"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+def read_proc_file(path: str) -> bytes | None:
+    """Me grab file from /proc in one bite."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 65536)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def iter_psutil_rows(cpu_threshold: float, mem_kb_threshold: float):
+    """Me ask psutil spirit about every process. No ps needed.
+
+    Linux ps count fire over whole life of process, so me do same there.
+    Mac ps count fire from last little while, so there me peek twice and
+    count fire eaten in between.
+    """
+    attrs = ["pid", "name", "cpu_times", "create_time", "memory_info"]
+    first_peek = []
+    for p in psutil.process_iter(attrs):
+        info = p.info
+        if info["cpu_times"] is None or info["memory_info"] is None:
+            continue
+        first_peek.append((p, time.monotonic()))
+
+    lifetime = sys.platform.startswith("linux")
+    if not lifetime:
+        time.sleep(CPU_SAMPLE_SECONDS)
+    now = time.time()
+
+    for p, seen in first_peek:
+        info = p.info
+        busy = info["cpu_times"].user + info["cpu_times"].system
+        if lifetime:
+            if info["create_time"] is None:
+                continue
+            elapsed = now - info["create_time"]
+        else:
+            try:
+                times = p.cpu_times()
+            except psutil.Error:
+                continue
+            busy = max(times.user + times.system - busy, 0.0)
+            elapsed = time.monotonic() - seen
+        cpu = round(100 * busy / elapsed, 1) if elapsed > 0 else 0.0
+        mem_kb = info["memory_info"].rss / 1024
+        if cpu < cpu_threshold and mem_kb < mem_kb_threshold:
+            continue
 
-    processes = []
-    for line in result.stdout.strip().split("\n")[1:]:
-        parts = line.split(None, 4)
-        if len(parts) < 5:
+        name = info["name"] or ""
+        try:
+            command = " ".join(p.cmdline())[:COMMAND_SCAN_CHARS] or name
+        except psutil.Error:
+            command = name
+        yield info["pid"], cpu, mem_kb, name, command
+
+
+def iter_proc_rows(cpu_threshold: float, mem_kb_threshold: float):
+    """Me read /proc scratchings direct. No ps needed.
+
+    Me only read cmdline for greedy process, so quiet one cost one file.
+    """
+    uptime_raw = read_proc_file("/proc/uptime")
+    if uptime_raw is None:
+        return
+    uptime = float(uptime_raw.split()[0])
+    clk_tck = os.sysconf("SC_CLK_TCK")
+    page_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+    rss_pages_threshold = mem_kb_threshold / page_kb
+
+    with os.scandir("/proc") as it:
+        pids = [entry.name for entry in it if entry.name.isdigit()]
+
+    for pid in pids:
+        stat = read_proc_file(f"/proc/{pid}/stat")
+        if not stat:
             continue
 
+        # comm sit in (parens) and may have space, so split after last ')'
+        head, _, rest = stat.rpartition(b")")
+        name = head.partition(b"(")[2].decode(errors="replace")
+        fields = rest.split()
         try:
-            pid = int(parts[0])
-            cpu = float(parts[1])
-            mem_kb = float(parts[2])
-            name = parts[3]
-            command = parts[4] if len(parts) > 4 else name
+            busy = (int(fields[11]) + int(fields[12])) / clk_tck
+            started = int(fields[19]) / clk_tck
+            rss_pages = int(fields[21])
         except (ValueError, IndexError):
             continue
 
-        mem_mb = mem_kb / 1024
+        elapsed = uptime - started
+        cpu = round(100 * busy / elapsed, 1) if elapsed > 0 else 0.0
+        if cpu < cpu_threshold and rss_pages < rss_pages_threshold:
+            continue
+        mem_kb = rss_pages * page_kb
+
+        cmdline = read_proc_file(f"/proc/{pid}/cmdline")
+        if cmdline:
+            cmdline = cmdline.rstrip(b"\0")[:COMMAND_SCAN_CHARS]
+            command = cmdline.translate(CMDLINE_SPACES).decode(errors="replace")
+        else:
+            command = f"[{name}]"
+        yield int(pid), cpu, mem_kb, name, command
 
-        if cpu < cpu_threshold and mem_mb < mem_threshold:
+
+def iter_ps_rows(cpu_threshold: float, mem_kb_threshold: float):
+    """Me ask ps about every process. Slow way, work everywhere."""
+    cmd = ["ps", "-eo", "pid,pcpu,rss,comm,args"]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+    next(proc.stdout, None)  # skip header
+    for line in proc.stdout:
+        match = PS_LINE_RE.match(line)
+        if not match:
             continue
 
+        pid, cpu, mem_kb, name, command = match.groups()
+        # Most process sleep (no fire), so fire check first. Parse rest only for greedy ones.
+        cpu = float(cpu)
+        if cpu < cpu_threshold and int(mem_kb) < mem_kb_threshold:
+            continue
+
+        command = command[:COMMAND_SCAN_CHARS].decode(errors="replace")
+        yield int(pid), cpu, int(mem_kb), name.decode(errors="replace"), command
+    proc.stdout.close()
+    proc.wait()
+
+
+def iter_process_rows(cpu_threshold: float, mem_threshold: float):
+    """Me pick fastest way to see greedy process: psutil, then /proc, then ps."""
+    mem_kb_threshold = mem_threshold * 1024
+    if psutil is not None:
+        return iter_psutil_rows(cpu_threshold, mem_kb_threshold)
+    if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+        return iter_proc_rows(cpu_threshold, mem_kb_threshold)
+    return iter_ps_rows(cpu_threshold, mem_kb_threshold)
+
+
+def hunger(p: ProcessInfo) -> float:
+    """How greedy is creature. Bigger number, bonk sooner."""
+    return p.cpu_percent + (p.mem_mb / 100)
+
+
+def sort_by_hunger(pile: list[ProcessInfo]) -> list[ProcessInfo]:
+    """Put greediest creature first."""
+    return sorted(pile, key=hunger, reverse=True)
+
+
+def get_processes(cpu_threshold: float, mem_threshold: float) -> tuple[list[ProcessInfo], list[ProcessInfo]]:
+    """Me look at all process. Find greedy ones.
+
+    Return (bonk-now pile, ask-first pile). Sacred ones thrown out right away.
+    """
+    auto_kill = []
+    ask = []
+    for pid, cpu, mem_kb, name, command in iter_process_rows(cpu_threshold, mem_threshold):
+        mem_mb = mem_kb / 1024
+
         if "hunt_processes" in command:
             continue
 
         category, reason = categorize_process(name, command)
+        if category == "IGNORE":
+            continue
 
-        processes.append(ProcessInfo(
+        pile = auto_kill if category == "AUTO_KILL" else ask
+        pile.append(ProcessInfo(
             pid=pid,
             name=name,
             cpu_percent=cpu,
@@ -118,75 +291,78 @@ def get_processes(cpu_threshold: float, mem_threshold: float) -> list[ProcessInf
             reason=reason,
         ))
 
-    processes.sort(key=lambda p: p.cpu_percent + (p.mem_mb / 100), reverse=True)
-    return processes
+    return sort_by_hunger(auto_kill), sort_by_hunger(ask)
 
 
 def categorize_process(name: str, command: str) -> tuple[Category, str]:
     """Me decide: bonk, ask, or no touch."""
-    full_str = f"{name} {command}".lower()
-
-    for pattern in IGNORE_PATTERNS:
-        if re.search(pattern, name, re.IGNORECASE):
-            return "IGNORE", "Sacred spirit - NO TOUCH"
+    if IGNORE_RE.search(name):
+        return "IGNORE", "Sacred spirit - NO TOUCH"
 
-    for pattern, desc in AUTO_KILL_PATTERNS:
-        if re.search(pattern, full_str, re.IGNORECASE):
-            return "AUTO_KILL", desc
+    # AUTO_KILL_RE ignore case already, no need lower(). Command hold
+    # program name too, so no need glue name on front.
+    match = AUTO_KILL_RE.match(command)
+    if match:
+        return "AUTO_KILL", AUTO_KILL_DESCS[match.lastgroup]
 
     return "ASK", "Mystery creature - me not know"
 
 
-def format_output(processes: list[ProcessInfo], as_json: bool) -> str:
-    """Make pretty output for human eye-holes."""
-    if as_json:
-        return json.dumps([{
-            "pid": p.pid,
-            "name": p.name,
-            "cpu_percent": p.cpu_percent,
-            "mem_mb": round(p.mem_mb, 1),
-            "command": p.command,
-            "category": p.category,
-            "reason": p.reason,
-        } for p in processes], indent=2)
+def write_json(auto_kill: list[ProcessInfo], ask: list[ProcessInfo]) -> None:
+    """Send fancy tribe format straight to stdout. No big string in middle."""
+    processes = heapq.merge(auto_kill, ask, key=hunger, reverse=True)
+    rows = [{
+        "pid": p.pid,
+        "name": p.name,
+        "cpu_percent": p.cpu_percent,
+        "mem_mb": round(p.mem_mb, 1),
+        "command": p.command,
+        "category": p.category,
+        "reason": p.reason,
+    } for p in processes]
 
-    lines = []
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        json.dump(rows, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
-    auto_kill = [p for p in processes if p.category == "AUTO_KILL"]
-    ask = [p for p in processes if p.category == "ASK"]
+
+def write_report(auto_kill: list[ProcessInfo], ask: list[ProcessInfo]) -> None:
+    """Make pretty output for human eye-holes. Scratch straight on stdout."""
+    write = sys.stdout.write
 
     if auto_kill:
-        lines.append("")
-        lines.append("    🦴 BONK NOW! (me know these bad)")
-        lines.append("    " + "~" * 50)
+        write("\n")
+        write("    🦴 BONK NOW! (me know these bad)\n")
+        write("    " + "~" * 50 + "\n")
         for p in auto_kill:
             fire = "🔥" * min(int(p.cpu_percent / 20) + 1, 5)
             rocks = "🪨" * min(int(p.mem_mb / 500) + 1, 5)
-            lines.append(f"      PID {p.pid:>6} │ Fire: {p.cpu_percent:>5.1f}% {fire}")
-            lines.append(f"                  │ Rock: {p.mem_mb:>6.1f}MB {rocks}")
-            lines.append(f"                  │ What: {p.reason}")
-            lines.append(f"                  │ Name: {p.name}")
-            lines.append("")
+            write(f"      PID {p.pid:>6} │ Fire: {p.cpu_percent:>5.1f}% {fire}\n")
+            write(f"                  │ Rock: {p.mem_mb:>6.1f}MB {rocks}\n")
+            write(f"                  │ What: {p.reason}\n")
+            write(f"                  │ Name: {p.name}\n")
+            write("\n")
 
     if ask:
-        lines.append("")
-        lines.append("    🤔 ME NOT SURE! (you decide bonk)")
-        lines.append("    " + "~" * 50)
+        write("\n")
+        write("    🤔 ME NOT SURE! (you decide bonk)\n")
+        write("    " + "~" * 50 + "\n")
         for p in ask:
             fire = "🔥" * min(int(p.cpu_percent / 20) + 1, 5)
             rocks = "🪨" * min(int(p.mem_mb / 500) + 1, 5)
-            lines.append(f"      PID {p.pid:>6} │ Fire: {p.cpu_percent:>5.1f}% {fire}")
-            lines.append(f"                  │ Rock: {p.mem_mb:>6.1f}MB {rocks}")
-            lines.append(f"                  │ What: {p.command[:50]}")
-            lines.append("")
+            write(f"      PID {p.pid:>6} │ Fire: {p.cpu_percent:>5.1f}% {fire}\n")
+            write(f"                  │ Rock: {p.mem_mb:>6.1f}MB {rocks}\n")
+            write(f"                  │ What: {p.command[:50]}\n")
+            write("\n")
 
     if not auto_kill and not ask:
-        lines.append("")
-        lines.append("    ✨ CAVE CLEAN! No greedy process found!")
-        lines.append("    Me rest now. Zzzzz...")
-        lines.append("")
-
-    return "\n".join(lines)
+        write("\n")
+        write("    ✨ CAVE CLEAN! No greedy process found!\n")
+        write("    Me rest now. Zzzzz...\n")
+        write("\n")
 
 
 def main():
@@ -205,10 +381,12 @@ def main():
     print("    ┃  ᕦ(ò_óˇ)ᕤ  Me find greedy process!              ┃")
     print("    ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛")
 
-    processes = get_processes(args.cpu_threshold, args.mem_threshold)
-    visible = [p for p in processes if p.category != "IGNORE"]
+    auto_kill, ask = get_processes(args.cpu_threshold, args.mem_threshold)
 
-    print(format_output(visible, args.json))
+    if args.json:
+        write_json(auto_kill, ask)
+    else:
+        write_report(auto_kill, ask)
 
 
 if __name__ == "__main__":
@@ -9,15 +9,93 @@ Usage:
     python measure_power.py status   # Quick peek at juice rock
 """
 
-import subprocess
+import ctypes
+import functools
+import os
 import json
 import sys
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 BASELINE_FILE = Path("/tmp/caveman_juice_memory.json")
 
+PMSET_PERCENT_RE = re.compile(r"(\d+)%")
+PMSET_REMAINING_RE = re.compile(r"(\d+:\d+) remaining")
+
+# How long me watch creatures between two peeks when counting fire.
+CPU_SAMPLE_SECONDS = 0.2
+
+# Cave paintings drawn once. Only numbers change per hunt.
+_ART_MAMMOTH = """
+    ╭────────────────────────────────────────────╮
+    │  🦣 MAMMOTH-SIZE VICTORY! 🦣                │
+    │                                            │
+    │      BEFORE           AFTER                │
+    │     ┌──────┐        ┌──────┐              │
+    │     │{before:^6}│  >>>  │{after:^6}│  +{diff} sun-moves│
+    │     └──────┘        └──────┘              │
+    │                                            │
+    │  ✨ Lightning rock VERY happy! ✨          │
+    │     Tribe can watch many more fire!        │
+    ╰────────────────────────────────────────────╯
+"""
+
+_ART_GOOD_HUNT = """
+    ╭────────────────────────────────────────────╮
+    │  🦴 GOOD HUNT! Caveman proud!              │
+    │                                            │
+    │   {before:>5} sun  ──────►  {after:>5} sun           │
+    │                                            │
+    │   Lightning rock last +{diff} more sun-moves! │
+    ╰────────────────────────────────────────────╯
+"""
+
+_ART_LITTLE_BETTER = """
+    ╭────────────────────────────────────────────╮
+    │  👍 Little bit better. Me take it.         │
+    │   {before:>5} sun  ──►  {after:>5} sun (+{diff} sun)      │
+    ╰────────────────────────────────────────────╯
+"""
+
+_ART_SAME = """
+    ╭────────────────────────────────────────────╮
+    │  🤷 Hmm. Same same. Maybe need wait.       │
+    │     Lightning rock still thinking...       │
+    ╰────────────────────────────────────────────╯
+"""
+
+_ART_WORSE = """
+    ╭────────────────────────────────────────────╮
+    │  😕 Ugh? Number go down?                   │
+    │   {before:>5} sun  ──►  {after:>5} sun ({diff} sun)      │
+    │   Lightning rock confused. Wait bit.       │
+    ╰────────────────────────────────────────────╯
+"""
+
+_ART_KILL = """
+    ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
+    ┃  {skulls:^41}  ┃
+    ┃  {clubs:^41}  ┃
+    ┃                                             ┃
+    ┃   Creatures Bonked: {killed_count:>3}                      ┃
+    ┃   Cave Space Free: ~{mem_freed_gb:.1f} big rocks            ┃
+    ┃                                             ┃
+    ┃   OOGA BOOGA! GOOD HUNT!                    ┃
+    ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
+"""
+
 
 def get_juice_bar(percentage: int, width: int = 20) -> str:
     """Make picture of juice level with cave painting."""
@@ -60,51 +138,15 @@ def get_comparison_art(before_min: int, after_min: int) -> str:
     diff = after_min - before_min
 
     if diff > 30:
-        art = """
-    ╭────────────────────────────────────────────╮
-    │  🦣 MAMMOTH-SIZE VICTORY! 🦣                │
-    │                                            │
-    │      BEFORE           AFTER                │
-    │     ┌──────┐        ┌──────┐              │
-    │     │{before:^6}│  >>>  │{after:^6}│  +{diff} sun-moves│
-    │     └──────┘        └──────┘              │
-    │                                            │
-    │  ✨ Lightning rock VERY happy! ✨          │
-    │     Tribe can watch many more fire!        │
-    ╰────────────────────────────────────────────╯
-"""
+        art = _ART_MAMMOTH
     elif diff > 10:
-        art = """
-    ╭────────────────────────────────────────────╮
-    │  🦴 GOOD HUNT! Caveman proud!              │
-    │                                            │
-    │   {before:>5} sun  ──────►  {after:>5} sun           │
-    │                                            │
-    │   Lightning rock last +{diff} more sun-moves! │
-    ╰────────────────────────────────────────────╯
-"""
+        art = _ART_GOOD_HUNT
     elif diff > 0:
-        art = """
-    ╭────────────────────────────────────────────╮
-    │  👍 Little bit better. Me take it.         │
-    │   {before:>5} sun  ──►  {after:>5} sun (+{diff} sun)      │
-    ╰────────────────────────────────────────────╯
-"""
+        art = _ART_LITTLE_BETTER
     elif diff == 0:
-        art = """
-    ╭────────────────────────────────────────────╮
-    │  🤷 Hmm. Same same. Maybe need wait.       │
-    │     Lightning rock still thinking...       │
-    ╰────────────────────────────────────────────╯
-"""
+        art = _ART_SAME
     else:
-        art = """
-    ╭────────────────────────────────────────────╮
-    │  😕 Ugh? Number go down?                   │
-    │   {before:>5} sun  ──►  {after:>5} sun ({diff} sun)      │
-    │   Lightning rock confused. Wait bit.       │
-    ╰────────────────────────────────────────────╯
-"""
+        art = _ART_WORSE
 
     return art.format(before=before_min, after=after_min, diff=diff)
 
@@ -117,46 +159,273 @@ def get_process_kill_art(killed_count: int, mem_freed_gb: float) -> str:
     skulls = "💀" * min(killed_count, 5)
     clubs = "🏏" * min(killed_count, 5)
 
-    return f"""
-    ┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓
-    ┃  {skulls:^41}  ┃
-    ┃  {clubs:^41}  ┃
-    ┃                                             ┃
-    ┃   Creatures Bonked: {killed_count:>3}                      ┃
-    ┃   Cave Space Free: ~{mem_freed_gb:.1f} big rocks            ┃
-    ┃                                             ┃
-    ┃   OOGA BOOGA! GOOD HUNT!                    ┃
-    ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
-"""
+    return _ART_KILL.format(
+        skulls=skulls, clubs=clubs, killed_count=killed_count, mem_freed_gb=mem_freed_gb
+    )
 
 
-def get_battery_info() -> dict:
-    """Ask lightning rock how much juice left."""
-    result = subprocess.run(["pmset", "-g", "batt"], capture_output=True, text=True)
-    output = result.stdout
+class ProcBsdInfo(ctypes.Structure):
+    _fields_ = [
+        ("pbi_flags", ctypes.c_uint32),
+        ("pbi_status", ctypes.c_uint32),
+        ("pbi_xstatus", ctypes.c_uint32),
+        ("pbi_pid", ctypes.c_uint32),
+        ("pbi_ppid", ctypes.c_uint32),
+        ("pbi_uid", ctypes.c_uint32),
+        ("pbi_gid", ctypes.c_uint32),
+        ("pbi_ruid", ctypes.c_uint32),
+        ("pbi_rgid", ctypes.c_uint32),
+        ("pbi_svuid", ctypes.c_uint32),
+        ("pbi_svgid", ctypes.c_uint32),
+        ("rfu_1", ctypes.c_uint32),
+        ("pbi_comm", ctypes.c_char * 16),
+        ("pbi_name", ctypes.c_char * 32),
+        ("pbi_nfiles", ctypes.c_uint32),
+        ("pbi_pgid", ctypes.c_uint32),
+        ("pbi_pjobc", ctypes.c_uint32),
+        ("e_tdev", ctypes.c_uint32),
+        ("e_tpgid", ctypes.c_uint32),
+        ("pbi_nice", ctypes.c_int32),
+        ("pbi_start_tvsec", ctypes.c_uint64),
+        ("pbi_start_tvusec", ctypes.c_uint64),
+    ]
+
+
+class ProcTaskInfo(ctypes.Structure):
+    _fields_ = [
+        ("pti_virtual_size", ctypes.c_uint64),
+        ("pti_resident_size", ctypes.c_uint64),
+        ("pti_total_user", ctypes.c_uint64),
+        ("pti_total_system", ctypes.c_uint64),
+        ("pti_threads_user", ctypes.c_uint64),
+        ("pti_threads_system", ctypes.c_uint64),
+        ("pti_policy", ctypes.c_int32),
+        ("pti_faults", ctypes.c_int32),
+        ("pti_pageins", ctypes.c_int32),
+        ("pti_cow_faults", ctypes.c_int32),
+        ("pti_messages_sent", ctypes.c_int32),
+        ("pti_messages_received", ctypes.c_int32),
+        ("pti_syscalls_mach", ctypes.c_int32),
+        ("pti_syscalls_unix", ctypes.c_int32),
+        ("pti_csw", ctypes.c_int32),
+        ("pti_threadnum", ctypes.c_int32),
+        ("pti_numrunning", ctypes.c_int32),
+        ("pti_priority", ctypes.c_int32),
+    ]
+
+
+class ProcTaskAllInfo(ctypes.Structure):
+    _fields_ = [("pbsd", ProcBsdInfo), ("ptinfo", ProcTaskInfo)]
+
+
+class MachTimebaseInfo(ctypes.Structure):
+    _fields_ = [("numer", ctypes.c_uint32), ("denom", ctypes.c_uint32)]
+
+
+PROC_ALL_PIDS = 1
+PROC_PIDTASKALLINFO = 2
+CF_STRING_ENCODING_UTF8 = 0x08000100
+CF_NUMBER_SINT32_TYPE = 3
+
+
+def load_darwin_libs():
+    """Me find magic rock-talking books. Only on Mac cave."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+        iokit = ctypes.CDLL("/System/Library/Frameworks/IOKit.framework/IOKit")
+        libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib")
+    except OSError:
+        return None
+
+    vp = ctypes.c_void_p
+    iokit.IOPSCopyPowerSourcesInfo.restype = vp
+    iokit.IOPSCopyPowerSourcesList.argtypes = [vp]
+    iokit.IOPSCopyPowerSourcesList.restype = vp
+    iokit.IOPSGetPowerSourceDescription.argtypes = [vp, vp]
+    iokit.IOPSGetPowerSourceDescription.restype = vp
+    iokit.IOPSGetProvidingPowerSourceType.argtypes = [vp]
+    iokit.IOPSGetProvidingPowerSourceType.restype = vp
+
+    cf.CFArrayGetCount.argtypes = [vp]
+    cf.CFArrayGetCount.restype = ctypes.c_long
+    cf.CFArrayGetValueAtIndex.argtypes = [vp, ctypes.c_long]
+    cf.CFArrayGetValueAtIndex.restype = vp
+    cf.CFDictionaryGetValue.argtypes = [vp, vp]
+    cf.CFDictionaryGetValue.restype = vp
+    cf.CFStringCreateWithCString.argtypes = [vp, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFStringCreateWithCString.restype = vp
+    cf.CFStringGetCString.argtypes = [vp, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+    cf.CFStringGetCString.restype = ctypes.c_bool
+    cf.CFNumberGetValue.argtypes = [vp, ctypes.c_int, vp]
+    cf.CFNumberGetValue.restype = ctypes.c_bool
+    cf.CFBooleanGetValue.argtypes = [vp]
+    cf.CFBooleanGetValue.restype = ctypes.c_bool
+    cf.CFRelease.argtypes = [vp]
+
+    libproc.proc_listpids.argtypes = [ctypes.c_uint32, ctypes.c_uint32, vp, ctypes.c_int]
+    libproc.proc_listpids.restype = ctypes.c_int
+    libproc.proc_pidinfo.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_uint64, vp, ctypes.c_int]
+    libproc.proc_pidinfo.restype = ctypes.c_int
+
+    libsystem.mach_timebase_info.argtypes = [ctypes.POINTER(MachTimebaseInfo)]
+
+    return cf, iokit, libproc, libsystem
+
+
+DARWIN_LIBS = load_darwin_libs()
+
+
+def battery_info_from_iokit() -> dict | None:
+    """Ask lightning rock direct through IOKit. No pmset fork."""
+    if DARWIN_LIBS is None:
+        return None
+    cf, iokit, _, _ = DARWIN_LIBS
+
+    def cf_str(text: str):
+        return cf.CFStringCreateWithCString(None, text.encode(), CF_STRING_ENCODING_UTF8)
+
+    def to_str(ref) -> str | None:
+        if not ref:
+            return None
+        buf = ctypes.create_string_buffer(256)
+        if not cf.CFStringGetCString(ref, buf, len(buf), CF_STRING_ENCODING_UTF8):
+            return None
+        return buf.value.decode()
+
+    def to_int(ref) -> int | None:
+        if not ref:
+            return None
+        value = ctypes.c_int32()
+        if not cf.CFNumberGetValue(ref, CF_NUMBER_SINT32_TYPE, ctypes.byref(value)):
+            return None
+        return value.value
+
+    blob = iokit.IOPSCopyPowerSourcesInfo()
+    if not blob:
+        return None
+    sources = iokit.IOPSCopyPowerSourcesList(blob)
+    keys = {name: cf_str(name) for name in (
+        "Type", "Current Capacity", "Max Capacity", "Time to Empty",
+        "Time to Full Charge", "Is Charging", "Is Charged",
+    )}
+    try:
+        providing = to_str(iokit.IOPSGetProvidingPowerSourceType(blob))
+        battery = None
+        for i in range(cf.CFArrayGetCount(sources) if sources else 0):
+            desc = iokit.IOPSGetPowerSourceDescription(blob, cf.CFArrayGetValueAtIndex(sources, i))
+            if desc and to_str(cf.CFDictionaryGetValue(desc, keys["Type"])) == "InternalBattery":
+                battery = desc
+                break
+
+        def get(key):
+            return cf.CFDictionaryGetValue(battery, keys[key]) if battery else None
+
+        current = to_int(get("Current Capacity"))
+        maximum = to_int(get("Max Capacity")) or 100
+        charging_ref = get("Is Charging")
+        charged_ref = get("Is Charged")
+        is_charging = bool(charging_ref) and cf.CFBooleanGetValue(charging_ref)
+        is_charged = bool(charged_ref) and cf.CFBooleanGetValue(charged_ref)
+        on_battery = providing == "Battery Power"
+        minutes = to_int(get("Time to Empty" if on_battery else "Time to Full Charge"))
+    finally:
+        for key in keys.values():
+            if key:
+                cf.CFRelease(key)
+        if sources:
+            cf.CFRelease(sources)
+        cf.CFRelease(blob)
+
+    info = {
+        "timestamp": time.time_ns(),
+        "percentage": round(current * 100 / maximum) if current is not None else None,
+        "status": None,
+        "time_remaining": None,
+        "raw": f"Now drawing from '{providing}'",
+    }
+
+    if battery is not None and on_battery:
+        info["status"] = "juice leaving"
+    elif is_charging:
+        info["status"] = "eating lightning"
+    elif is_charged:
+        info["status"] = "belly full"
+    elif providing == "AC Power":
+        info["status"] = "plugged to wall-vine"
+
+    # IOKit say -1 while rock still thinking how long
+    if battery is not None and minutes is not None and minutes > 0:
+        info["time_remaining"] = f"{minutes // 60}:{minutes % 60:02d}"
+        info["time_remaining_minutes"] = minutes
+
+    return info
+
+
+def spawn_capture(argv: list[str]) -> bytes:
+    """Send messenger straight, no subprocess middle-man. Bring back what he say.
+
+    argv[0] is full path so no hunt through PATH. If stone not at that spot,
+    messenger go look in PATH after all.
+    """
+    # os.pipe fds already close-on-exec (PEP 446). DUP2 onto fd 1 clear that in child.
+    r, w = os.pipe()
+    file_actions = [
+        (os.POSIX_SPAWN_DUP2, w, 1),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_CLOSE, w),
+    ]
+    try:
+        try:
+            pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=file_actions)
+        except FileNotFoundError:
+            pid = os.posix_spawnp(os.path.basename(argv[0]), argv, os.environ,
+                                  file_actions=file_actions)
+    except BaseException:
+        os.close(r)
+        raise
+    finally:
+        os.close(w)
+
+    chunks = []
+    try:
+        while chunk := os.read(r, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(r)
+        os.waitpid(pid, 0)
+    return b"".join(chunks)
+
+
+def battery_info_from_pmset() -> dict:
+    """Ask lightning rock how much juice left, the slow pmset way."""
+    output = spawn_capture(["/usr/bin/pmset", "-g", "batt"]).decode(errors="replace")
 
     info = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": time.time_ns(),
         "percentage": None,
         "status": None,
         "time_remaining": None,
         "raw": output.strip(),
     }
 
-    pct_match = re.search(r"(\d+)%", output)
+    pct_match = PMSET_PERCENT_RE.search(output)
     if pct_match:
         info["percentage"] = int(pct_match.group(1))
 
-    if "discharging" in output.lower():
+    output_lower = output.lower()
+    if "discharging" in output_lower:
         info["status"] = "juice leaving"
-    elif "charging" in output.lower():
+    elif "charging" in output_lower:
         info["status"] = "eating lightning"
-    elif "charged" in output.lower():
+    elif "charged" in output_lower:
         info["status"] = "belly full"
     elif "AC Power" in output:
         info["status"] = "plugged to wall-vine"
 
-    time_match = re.search(r"(\d+:\d+) remaining", output)
+    time_match = PMSET_REMAINING_RE.search(output)
     if time_match:
         info["time_remaining"] = time_match.group(1)
         h, m = map(int, time_match.group(1).split(":"))
@@ -165,68 +434,228 @@ def get_battery_info() -> dict:
     return info
 
 
-def get_top_cpu_processes(n: int = 5) -> list:
-    """Find which creature eating most fire."""
-    result = subprocess.run(
-        ["ps", "-eo", "pid,pcpu,rss,comm", "-r"],
-        capture_output=True, text=True
-    )
+@functools.lru_cache(maxsize=1)
+def get_battery_info() -> dict:
+    """Ask lightning rock how much juice left."""
+    return battery_info_from_iokit() or battery_info_from_pmset()
+
+
+def top_processes_from_psutil(n: int) -> list | None:
+    """Count fire for every creature with psutil.
+
+    Fire = CPU time eaten between two peeks, same as libproc way.
+    """
+    if psutil is None:
+        return None
+
+    first_peek = []
+    for proc in psutil.process_iter(["pid", "name"]):
+        try:
+            times = proc.cpu_times()
+        except psutil.Error:
+            continue
+        first_peek.append((proc, times.user + times.system, time.monotonic()))
+
+    time.sleep(CPU_SAMPLE_SECONDS)
+
     processes = []
-    for line in result.stdout.strip().split("\n")[1:n+1]:
+    for proc, busy_before, seen in first_peek:
+        try:
+            with proc.oneshot():
+                times = proc.cpu_times()
+                rss = proc.memory_info().rss
+        except psutil.Error:
+            continue
+
+        busy = max(times.user + times.system - busy_before, 0.0)
+        elapsed = time.monotonic() - seen
+        processes.append({
+            "pid": proc.info["pid"],
+            "cpu": round(100 * busy / elapsed, 1) if elapsed > 0 else 0.0,
+            "mem_mb": rss / (1024 * 1024),
+            "name": proc.info["name"] or "",
+        })
+
+    processes.sort(key=lambda p: p["cpu"], reverse=True)
+    return processes[:n]
+
+
+def top_processes_from_libproc(n: int) -> list | None:
+    """Count fire for every creature with libproc. No ps fork.
+
+    Fire = CPU time eaten between two peeks, like ps pcpu on Mac show fire
+    from last little while. Creature of other tribe (other user) not let
+    me look unless me root, so those get skip.
+    """
+    if DARWIN_LIBS is None:
+        return None
+    _, _, libproc, libsystem = DARWIN_LIBS
+
+    timebase = MachTimebaseInfo()
+    libsystem.mach_timebase_info(ctypes.byref(timebase))
+    ns_per_tick = timebase.numer / timebase.denom if timebase.denom else 1.0
+
+    size = libproc.proc_listpids(PROC_ALL_PIDS, 0, None, 0)
+    if size <= 0:
+        return None
+    pids = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int) + 64))()
+    size = libproc.proc_listpids(PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+    if size <= 0:
+        return None
+
+    info = ProcTaskAllInfo()
+    info_size = ctypes.sizeof(info)
+
+    def busy_ticks(pid: int) -> int | None:
+        if libproc.proc_pidinfo(pid, PROC_PIDTASKALLINFO, 0, ctypes.byref(info), info_size) != info_size:
+            return None
+        return info.ptinfo.pti_total_user + info.ptinfo.pti_total_system
+
+    first_peek = {}
+    for pid in pids[: size // ctypes.sizeof(ctypes.c_int)]:
+        if pid <= 0:
+            continue
+        ticks = busy_ticks(pid)
+        if ticks is not None:
+            first_peek[pid] = (ticks, time.monotonic())
+
+    time.sleep(CPU_SAMPLE_SECONDS)
+
+    processes = []
+    for pid, (ticks_before, seen) in first_peek.items():
+        ticks = busy_ticks(pid)
+        if ticks is None:
+            continue
+
+        task = info.ptinfo
+        bsd = info.pbsd
+        busy = max(ticks - ticks_before, 0) * ns_per_tick / 1e9
+        elapsed = time.monotonic() - seen
+        processes.append({
+            "pid": pid,
+            "cpu": round(100 * busy / elapsed, 1) if elapsed > 0 else 0.0,
+            "mem_mb": task.pti_resident_size / (1024 * 1024),
+            "name": (bsd.pbi_name or bsd.pbi_comm).decode(errors="replace"),
+        })
+
+    processes.sort(key=lambda p: p["cpu"], reverse=True)
+    return processes[:n]
+
+
+def top_processes_from_ps(n: int) -> list:
+    """Find which creature eating most fire, the slow ps way."""
+    output = spawn_capture(["/bin/ps", "-eo", "pid,pcpu,rss,comm", "-r"])
+    processes = []
+    # Stay in raw bytes. Only creature name need turn into words.
+    for line in output.splitlines()[1:n+1]:
         parts = line.split(None, 3)
         if len(parts) >= 4:
             processes.append({
                 "pid": int(parts[0]),
                 "cpu": float(parts[1]),
                 "mem_mb": float(parts[2]) / 1024,
-                "name": parts[3],
+                "name": parts[3].decode(errors="replace"),
             })
     return processes
 
 
+@functools.lru_cache(maxsize=1)
+def get_top_cpu_processes(n: int = 5) -> list:
+    """Find which creature eating most fire."""
+    processes = top_processes_from_psutil(n)
+    if processes is None:
+        processes = top_processes_from_libproc(n)
+    if processes is None:
+        processes = top_processes_from_ps(n)
+    return processes
+
+
+def dump_json(data: dict) -> bytes:
+    """Squish memory into bytes. orjson fast if tribe have it."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def write_baseline(payload: bytes):
+    """Scratch memory on new rock, then swap rocks. Nobody see half-scratched rock."""
+    tmp = BASELINE_FILE.with_suffix(".json.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp, BASELINE_FILE)
+
+
+def load_baseline() -> dict:
+    """Dig up what caveman remember."""
+    raw = BASELINE_FILE.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def get_snapshot() -> tuple[dict, list]:
+    """Ask lightning rock and fire-eaters at same time. Both just wait on cave."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        battery = executor.submit(get_battery_info)
+        processes = executor.submit(get_top_cpu_processes)
+        return battery.result(), processes.result()
+
+
 def save_baseline(processes_killed: int = 0, mem_freed_mb: float = 0):
     """Caveman remember this moment for later compare."""
+    battery, top_processes = get_snapshot()
     data = {
-        "battery": get_battery_info(),
-        "top_processes": get_top_cpu_processes(),
+        "battery": battery,
+        "top_processes": top_processes,
         "processes_killed": processes_killed,
         "mem_freed_mb": mem_freed_mb,
     }
-    BASELINE_FILE.write_text(json.dumps(data, indent=2))
-
-    print("")
-    print("    ╔═══════════════════════════════════════╗")
-    print("    ║  🧠 CAVEMAN REMEMBER THIS MOMENT      ║")
-    print("    ╠═══════════════════════════════════════╣")
-    print(f"    ║   Juice Level: {data['battery']['percentage']:>3}%                  ║")
+    write_baseline(dump_json(data))
+
+    out: list[str] = []
+    out.append("\n")
+    out.append("    ╔═══════════════════════════════════════╗\n")
+    out.append("    ║  🧠 CAVEMAN REMEMBER THIS MOMENT      ║\n")
+    out.append("    ╠═══════════════════════════════════════╣\n")
+    out.append(f"    ║   Juice Level: {data['battery']['percentage']:>3}%                  ║\n")
     if data['battery']['time_remaining']:
-        print(f"    ║   Sun-moves Left: {data['battery']['time_remaining']:>5}            ║")
-    print("    ╚═══════════════════════════════════════╝")
-    print("")
-    print("    💡 Now go bonk! Then run 'measure_power.py after'")
-    print("")
+        out.append(f"    ║   Sun-moves Left: {data['battery']['time_remaining']:>5}            ║\n")
+    out.append("    ╚═══════════════════════════════════════╝\n")
+    out.append("\n")
+    out.append("    💡 Now go bonk! Then run 'measure_power.py after'\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def show_impact_report(processes_killed: int = 0, mem_freed_mb: float = 0):
     """Show big celebration of successful hunt."""
     has_baseline = BASELINE_FILE.exists()
 
-    current = get_battery_info()
-    current_procs = get_top_cpu_processes()
+    current, current_procs = get_snapshot()
 
     mem_freed_gb = mem_freed_mb / 1024 if mem_freed_mb > 0 else 0
 
-    print("\n")
-    print("    ╔════════════════════════════════════════════════════════╗")
-    print("    ║     🦣 CAVEMAN HUNT REPORT 🦣                          ║")
-    print("    ║     ᕦ(ò_óˇ)ᕤ  Me show what happen!                     ║")
-    print("    ╚════════════════════════════════════════════════════════╝")
+    out: list[str] = []
+    out.append("\n\n")
+    out.append("    ╔════════════════════════════════════════════════════════╗\n")
+    out.append("    ║     🦣 CAVEMAN HUNT REPORT 🦣                          ║\n")
+    out.append("    ║     ᕦ(ò_óˇ)ᕤ  Me show what happen!                     ║\n")
+    out.append("    ╚════════════════════════════════════════════════════════╝\n")
 
     if processes_killed > 0:
-        print(get_process_kill_art(processes_killed, mem_freed_gb))
+        out.append(get_process_kill_art(processes_killed, mem_freed_gb) + "\n")
 
     if has_baseline:
-        baseline = json.loads(BASELINE_FILE.read_text())
+        baseline = load_baseline()
         before = baseline['battery']
         after = current
 
@@ -234,9 +663,9 @@ def show_impact_report(processes_killed: int = 0, mem_freed_mb: float = 0):
         after_min = after.get('time_remaining_minutes', 0)
 
         if before_min and after_min:
-            print(get_comparison_art(before_min, after_min))
+            out.append(get_comparison_art(before_min, after_min) + "\n")
 
-        print("\n    ┌─── FIRE BEFORE ───────┬─── FIRE AFTER ────────┐")
+        out.append("\n    ┌─── FIRE BEFORE ───────┬─── FIRE AFTER ────────┐\n")
         before_procs = baseline.get('top_processes', [])[:3]
         after_procs = current_procs[:3]
 
@@ -245,28 +674,29 @@ def show_impact_report(processes_killed: int = 0, mem_freed_mb: float = 0):
             a = after_procs[i] if i < len(after_procs) else {"cpu": 0, "name": "-"}
             b_str = f"{b['cpu']:>5.1f}% {b['name'][:12]:<12}"
             a_str = f"{a['cpu']:>5.1f}% {a['name'][:12]:<12}"
-            print(f"    │ {b_str} │ {a_str} │")
+            out.append(f"    │ {b_str} │ {a_str} │\n")
 
-        print("    └───────────────────────┴───────────────────────┘")
+        out.append("    └───────────────────────┴───────────────────────┘\n")
 
         before_total = sum(p['cpu'] for p in before_procs)
         after_total = sum(p['cpu'] for p in after_procs)
         reduction = before_total - after_total
 
         if reduction > 0:
-            print(f"\n    📉 Fire eating: {before_total:.0f}% → {after_total:.0f}% (↓{reduction:.0f}% less fire!)")
+            out.append(f"\n    📉 Fire eating: {before_total:.0f}% → {after_total:.0f}% (↓{reduction:.0f}% less fire!)\n")
 
     improved = has_baseline and processes_killed > 0
-    print("\n" + get_battery_art(current['percentage'], improved=improved))
+    out.append("\n" + get_battery_art(current['percentage'], improved=improved) + "\n")
 
     if current['time_remaining']:
-        print(f"\n    ⏱️  Sun-moves remaining: {current['time_remaining']}")
+        out.append(f"\n    ⏱️  Sun-moves remaining: {current['time_remaining']}\n")
 
-    print("\n    ════════════════════════════════════════════════════════")
+    out.append("\n    ════════════════════════════════════════════════════════\n")
     if processes_killed > 0:
-        print("    🌿 Magic lightning box breathe easy now!")
-        print("    🦴 Caveman did good. Tribe proud.")
-    print("")
+        out.append("    🌿 Magic lightning box breathe easy now!\n")
+        out.append("    🦴 Caveman did good. Tribe proud.\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def compare_to_baseline():
@@ -276,7 +706,7 @@ def compare_to_baseline():
         print("    Run 'measure_power.py before' first!")
         return
 
-    baseline = json.loads(BASELINE_FILE.read_text())
+    baseline = load_baseline()
     show_impact_report(
         processes_killed=baseline.get('processes_killed', 0),
         mem_freed_mb=baseline.get('mem_freed_mb', 0)
@@ -286,17 +716,23 @@ def compare_to_baseline():
 def show_status():
     """Quick look at lightning rock."""
     info = get_battery_info()
-    print("")
-    print("    🪨 LIGHTNING ROCK STATUS")
-    print("    " + "=" * 30)
-    print(get_battery_art(info['percentage']))
-    print(f"\n    What doing: {info['status']}")
+    out: list[str] = []
+    out.append("\n")
+    out.append("    🪨 LIGHTNING ROCK STATUS\n")
+    out.append("    " + "=" * 30 + "\n")
+    out.append(get_battery_art(info['percentage']) + "\n")
+    out.append(f"\n    What doing: {info['status']}\n")
     if info['time_remaining']:
-        print(f"    Sun-moves left: {info['time_remaining']}")
-    print("")
+        out.append(f"    Sun-moves left: {info['time_remaining']}\n")
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def main():
+    # Fresh look each run, even when main() called again in same cave
+    get_battery_info.cache_clear()
+    get_top_cpu_processes.cache_clear()
+
     if len(sys.argv) < 2:
         show_status()
         return
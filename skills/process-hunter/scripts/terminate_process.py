@@ -8,22 +8,59 @@ Usage:
 Me try gentle tap first. If process no listen, ME USE BIG CLUB.
 """
 
+import ctypes
 import subprocess
 import sys
 import time
 import signal
 import os
+import select
 import argparse
 
 
+PROC_NAME_MAX = 1024
+
+
+def name_from_proc(pid: int) -> str | None:
+    """Linux cave keep name scratched on wall. Me just read it."""
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            return f.read().strip().decode(errors="replace") or None
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+
+
+def name_from_libproc(pid: int) -> str | None:
+    """Mac cave: ask libproc straight. No need send messenger."""
+    libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+    libproc.proc_name.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32]
+    libproc.proc_name.restype = ctypes.c_int
+    buf = ctypes.create_string_buffer(PROC_NAME_MAX)
+    if libproc.proc_name(pid, buf, PROC_NAME_MAX) <= 0:
+        return None
+    return buf.value.decode(errors="replace") or None
+
+
+def name_from_ps(pid: int) -> str | None:
+    """Old way. Send ps messenger and wait for answer."""
+    result = subprocess.run(
+        ["ps", "-p", str(pid), "-o", "comm="],
+        capture_output=True, text=True
+    )
+    return result.stdout.strip() or None
+
+
 def get_process_name(pid: int) -> str | None:
     """Me look up name of creature."""
     try:
-        result = subprocess.run(
-            ["ps", "-p", str(pid), "-o", "comm="],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip() or None
+        if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+            return name_from_proc(pid)
+        if sys.platform == "darwin":
+            return name_from_libproc(pid)
+    except Exception:
+        pass
+    try:
+        return name_from_ps(pid)
     except Exception:
         return None
 
@@ -37,6 +74,52 @@ def is_running(pid: int) -> bool:
         return False
 
 
+def wait_for_exit(pid: int, timeout: float) -> bool:
+    """
+    Me wait for creature to fall down. Kernel poke me the moment it do.
+
+    Return True if creature gone before timeout.
+    """
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ENABLE | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            try:
+                return bool(kq.control([event], 1, timeout)) or not is_running(pid)
+            except ProcessLookupError:
+                return True
+        finally:
+            kq.close()
+
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(fd)
+
+    # No kernel poke here. Me peek every little bit instead.
+    deadline = time.monotonic() + timeout
+    while is_running(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
 def terminate(pid: int, force: bool = False) -> tuple[bool, str]:
     """
     ME BONK PROCESS.
@@ -62,17 +145,14 @@ def terminate(pid: int, force: bool = False) -> tuple[bool, str]:
         print(f"    👋 Me tap {name} (PID {pid}) gentle... 'Hey. You go now.'")
         print(f"    ⏳ Me wait...")
 
-        for _ in range(6):
-            time.sleep(0.5)
-            if not is_running(pid):
-                return True, f"    ✨ {name} listen to caveman! Walk away peaceful. Good process."
+        if wait_for_exit(pid, 3.0):
+            return True, f"    ✨ {name} listen to caveman! Walk away peaceful. Good process."
 
         # Still there? TIME FOR BIG CLUB
         print(f"    😤 Process no listen! ME GET BIG CLUB!")
         os.kill(pid, signal.SIGKILL)
-        time.sleep(0.5)
 
-        if not is_running(pid):
+        if wait_for_exit(pid, 0.5):
             return True, f"    💥 BONK! {name} (PID {pid}) no more. Should have listened first time!"
         else:
             return False, f"    😱 Impossible! {name} still alive after big club! Must be spirit!"
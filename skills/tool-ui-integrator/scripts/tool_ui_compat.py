@@ -4,68 +4,217 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TOOL_UI_REGISTRY_URL = "https://tool-ui.com/r/{name}.json"
 IGNORE_DIRS = {".git", ".next", "node_modules", "dist", "build", "coverage", "out"}
 SCAN_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".mdx"}
+SCAN_EXT_TUPLE = tuple(SCAN_EXTENSIONS)
+MODULE_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+SCAN_PARALLEL_MIN_FILES = 64
+SCAN_CACHE_VERSION = 1
+IMPORT_PATTERN = re.compile(
+    rb'from\s+["\'](@/components/tool-ui/[^"\']+)["\']|import\(\s*["\'](@/components/tool-ui/[^"\']+)["\']\s*\)',
+)
+ASSISTANT_IMPORT_PATTERN = re.compile(rb'[@]assistant-ui/react(?:-ai-sdk)?')
+# Literal substrings every match must contain; files without them skip the regex.
+IMPORT_NEEDLE = b"@/components/tool-ui/"
+ASSISTANT_IMPORT_NEEDLE = b"@assistant-ui/"
 
 
 def load_json(path: Path) -> dict:
-    return json.loads(path.read_text())
+    return json.loads(path.read_bytes())
+
+
+def dump_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(data, indent=2) + "\n").encode()
 
 
-def module_exists(base: Path) -> bool:
-    if base.exists():
+@functools.cache
+def _dir_entries(parent: str) -> dict[str, bool]:
+    # name -> is regular file, listed once per directory.
+    try:
+        with os.scandir(parent or os.curdir) as entries:
+            return {entry.name: entry.is_file() for entry in entries}
+    except OSError:
+        return {}
+
+
+@functools.lru_cache(maxsize=4096)
+def module_exists(base_str: str) -> bool:
+    parent, name = os.path.split(base_str)
+    if not name or name in (os.curdir, os.pardir):
+        return os.path.exists(base_str)
+
+    # An existing file or directory (whose index.* would live inside it) resolves as-is.
+    entries = _dir_entries(parent)
+    if name in entries:
         return True
+    # Try both foo.config + .ts and foo.js -> foo.ts (TypeScript ESM imports).
+    stem = os.path.splitext(name)[0]
+    return any(
+        entries.get(name + suffix, False) or entries.get(stem + suffix, False)
+        for suffix in MODULE_SUFFIXES
+    )
 
-    candidates = [
-        base.with_suffix(".ts"),
-        base.with_suffix(".tsx"),
-        base.with_suffix(".js"),
-        base.with_suffix(".jsx"),
-        base.with_suffix(".mjs"),
-        base.with_suffix(".cjs"),
-        base / "index.ts",
-        base / "index.tsx",
-        base / "index.js",
-        base / "index.jsx",
-        base / "index.mjs",
-        base / "index.cjs",
-    ]
-    return any(candidate.exists() for candidate in candidates)
-
-
-def iter_code_files(project_root: Path):
-    for path in project_root.rglob("*"):
-        if not path.is_file():
-            continue
 
-        if path.suffix not in SCAN_EXTENSIONS:
+def path_exists(path: Path) -> bool:
+    parent, name = os.path.split(os.fspath(path))
+    if not name or name in (os.curdir, os.pardir):
+        return path.exists()
+    return name in _dir_entries(parent)
+
+
+def iter_code_entries(project_root: Path):
+    pending = [os.fspath(project_root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(SCAN_EXT_TUPLE) and entry.is_file():
+                        yield entry
+        except OSError:
             continue
 
-        if any(part in IGNORE_DIRS for part in path.parts):
+
+def add_matches(imports: set[str], pattern: re.Pattern[bytes], data: bytes) -> None:
+    for match in pattern.finditer(data):
+        if match.lastindex:
+            for index in range(1, match.lastindex + 1):
+                value = match.group(index)
+                if value:
+                    imports.add(value.decode("utf-8", "ignore"))
+        else:
+            imports.add(match.group(0).decode("utf-8", "ignore"))
+
+
+def scan_file(
+    file_path: Path, patterns: dict[str, tuple[re.Pattern[bytes], bytes | None]]
+) -> dict[str, set[str]]:
+    data = file_path.read_bytes()
+    found: dict[str, set[str]] = {}
+    for name, (pattern, needle) in patterns.items():
+        if needle is not None and needle not in data:
             continue
+        add_matches(found.setdefault(name, set()), pattern, data)
 
-        yield path
+    return found
 
 
-def scan_imports(project_root: Path, pattern: re.Pattern[str]) -> set[str]:
-    imports: set[str] = set()
-    for file_path in iter_code_files(project_root):
-        text = file_path.read_text(errors="ignore")
-        for match in pattern.finditer(text):
-            if match.lastindex:
-                for index in range(1, match.lastindex + 1):
-                    value = match.group(index)
-                    if value:
-                        imports.add(value)
-            else:
-                imports.add(match.group(0))
+def scan_cache_path(project_root: Path) -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(os.fsencode(project_root)).hexdigest()[:16]
+    return Path(cache_home) / "tool-ui-compat" / f"{digest}.json"
+
+
+def scan_cache_key(patterns: dict[str, tuple[re.Pattern[bytes], bytes | None]]) -> str:
+    digest = hashlib.sha256(str(SCAN_CACHE_VERSION).encode())
+    for name in sorted(patterns):
+        pattern, needle = patterns[name]
+        digest.update(b"\0".join([name.encode(), pattern.pattern, needle or b""]))
+    return digest.hexdigest()
+
+
+def load_scan_cache(cache_path: Path, key: str) -> dict[str, list]:
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("key") != key:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
 
-    return imports
+
+def save_scan_cache(cache_path: Path, key: str, files: dict[str, list]) -> None:
+    payload = {"key": key, "files": files}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(payload))
+        else:
+            tmp_path.write_text(json.dumps(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def is_cache_hit(hit: object, stamp: list[int]) -> bool:
+    if not isinstance(hit, list) or len(hit) != 3 or hit[:2] != stamp:
+        return False
+    found = hit[2]
+    return isinstance(found, dict) and all(
+        isinstance(values, list) and all(isinstance(value, str) for value in values)
+        for values in found.values()
+    )
+
+
+def scan_imports_multi(
+    project_root: Path,
+    patterns: dict[str, tuple[re.Pattern[bytes], bytes | None]],
+    cache_path: Path | None = None,
+) -> dict[str, set[str]]:
+    results: dict[str, set[str]] = {name: set() for name in patterns}
+
+    # With a cache, files whose (mtime_ns, size) match the last run reuse their
+    # stored matches; only new or changed files are read again.
+    key = scan_cache_key(patterns) if cache_path is not None else ""
+    cached = load_scan_cache(cache_path, key) if cache_path is not None else {}
+    files: dict[str, list] = {}
+    to_scan: list[tuple[str, list[int]]] = []
+    for entry in iter_code_entries(project_root):
+        stamp: list[int] = []
+        if cache_path is not None:
+            try:
+                stat = entry.stat()
+                stamp = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                pass
+            hit = cached.get(entry.path)
+            if stamp and is_cache_hit(hit, stamp):
+                files[entry.path] = hit
+                for name, values in hit[2].items():
+                    if name in results:
+                        results[name].update(values)
+                continue
+        to_scan.append((entry.path, stamp))
+
+    if len(to_scan) < SCAN_PARALLEL_MIN_FILES:
+        per_file = (scan_file(Path(path), patterns) for path, _ in to_scan)
+    else:
+        # Reads release the GIL, so a few threads keep several reads in flight.
+        workers = min(8, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_file = list(executor.map(lambda item: scan_file(Path(item[0]), patterns), to_scan))
+
+    for (path, stamp), found in zip(to_scan, per_file):
+        for name, values in found.items():
+            results[name].update(values)
+        if stamp:
+            files[path] = [*stamp, {name: sorted(values) for name, values in found.items()}]
+
+    if cache_path is not None and (to_scan or len(files) != len(cached)):
+        save_scan_cache(cache_path, key, files)
+
+    return results
 
 
 def read_package_names(project_root: Path) -> set[str]:
@@ -86,7 +235,11 @@ def read_package_names(project_root: Path) -> set[str]:
     return names
 
 
-def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
+def run_checks(
+    project_root: Path, apply_fix: bool, doctor: bool, use_cache: bool = True
+) -> int:
+    module_exists.cache_clear()
+    _dir_entries.cache_clear()
     fail_count = 0
 
     def fail(message: str) -> None:
@@ -104,7 +257,7 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
         print(f"PASS: {message}")
 
     components_json_path = project_root / "components.json"
-    if not components_json_path.exists():
+    if not path_exists(components_json_path):
         fail("components.json not found at project root")
         print("Hint: initialize shadcn first, then retry.")
         return 1
@@ -160,7 +313,7 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
         tailwind_css = tailwind.get("css")
         if isinstance(tailwind_css, str) and tailwind_css:
             tailwind_css_path = project_root / tailwind_css
-            if tailwind_css_path.exists():
+            if path_exists(tailwind_css_path):
                 ok(f"tailwind.css path exists: {tailwind_css}")
             else:
                 fail(f"tailwind.css path not found: {tailwind_css}")
@@ -170,7 +323,7 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
         warn("components.json.tailwind missing")
 
     if apply_fix and changed:
-        components_json_path.write_text(json.dumps(components_data, indent=2) + "\n")
+        components_json_path.write_bytes(dump_json(components_data))
         info(f"updated {components_json_path}")
 
     if doctor:
@@ -182,31 +335,39 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
         else:
             warn("cannot resolve aliases.components to a filesystem path (requires '@/...')")
 
+        scanned = scan_imports_multi(
+            project_root,
+            {
+                "tool_ui": (IMPORT_PATTERN, IMPORT_NEEDLE),
+                "assistant": (ASSISTANT_IMPORT_PATTERN, ASSISTANT_IMPORT_NEEDLE),
+            },
+            cache_path=scan_cache_path(project_root) if use_cache else None,
+        )
+
         if components_dir is not None:
             tool_ui_dir = components_dir / "tool-ui"
             shared_dir = tool_ui_dir / "shared"
 
-            if tool_ui_dir.exists() and not shared_dir.exists():
+            shared_exists = path_exists(shared_dir)
+            if not shared_exists and path_exists(tool_ui_dir):
                 fail("components/tool-ui exists but components/tool-ui/shared is missing")
-            elif shared_dir.exists():
+            elif shared_exists:
                 ok("components/tool-ui/shared exists")
             else:
                 warn("components/tool-ui not found yet (no Tool UI components installed)")
 
-            import_pattern = re.compile(
-                r'from\s+["\'](@/components/tool-ui/[^"\']+)["\']|import\(\s*["\'](@/components/tool-ui/[^"\']+)["\']\s*\)',
-            )
-            tool_ui_imports = scan_imports(project_root, import_pattern)
+            tool_ui_imports = scanned["tool_ui"]
             missing_modules: list[str] = []
-            for module_path in sorted(tool_ui_imports):
+            root_prefix = os.fspath(project_root) + os.sep
+            for module_path in tool_ui_imports:
                 if not module_path.startswith("@/components/tool-ui/"):
                     continue
                 relative_module = module_path[len("@/") :]
-                base = project_root / relative_module
-                if not module_exists(base):
+                if not module_exists(root_prefix + relative_module):
                     missing_modules.append(module_path)
 
             if missing_modules:
+                missing_modules.sort()
                 fail("missing module paths for Tool UI imports:")
                 for module in missing_modules:
                     print(f"  - {module}")
@@ -214,8 +375,7 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
                 ok(f"resolved {len(tool_ui_imports)} Tool UI import paths")
 
         packages = read_package_names(project_root)
-        assistant_import_pattern = re.compile(r'[@]assistant-ui/react(?:-ai-sdk)?')
-        assistant_imports = scan_imports(project_root, assistant_import_pattern)
+        assistant_imports = scanned["assistant"]
 
         requires_react_pkg = any("@assistant-ui/react" in value for value in assistant_imports)
         requires_ai_sdk_pkg = any("@assistant-ui/react-ai-sdk" in value for value in assistant_imports)
@@ -236,7 +396,7 @@ def run_checks(project_root: Path, apply_fix: bool, doctor: bool) -> int:
     return 1 if fail_count > 0 else 0
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Tool UI compatibility checker")
     parser.add_argument("--project", default=".", help="Project root path (default: current directory)")
     parser.add_argument("--fix", action="store_true", help="Apply safe fixes to components.json")
@@ -245,12 +405,16 @@ def main() -> None:
         action="store_true",
         help="Run deeper checks: shared folder, imports, and package consistency",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every source file instead of reusing the doctor scan cache",
+    )
+    args = parser.parse_args(argv)
 
     project_root = Path(args.project).resolve()
-    exit_code = run_checks(project_root, args.fix, args.doctor)
-    raise SystemExit(exit_code)
+    return run_checks(project_root, args.fix, args.doctor, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -4,16 +4,37 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SPECIAL_SYMBOLS = {
     "x-post": "XPost",
     "linkedin-post": "LinkedInPost",
 }
 
+PARSER_OVERRIDES: dict[str, str] = {
+    "weather-widget": "safeParseWeatherWidgetPayload",
+}
+
+SCHEMA_OVERRIDES: dict[str, str] = {
+    "weather-widget": "WeatherWidgetPayloadSchema",
+}
+
+
+def parse_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def load_component_ids() -> set[str]:
+
+@functools.cache
+def load_component_ids() -> frozenset[str]:
     skill_root = Path(__file__).resolve().parents[1]
     data_path = skill_root / "references" / "components-data.json"
     if not data_path.exists():
@@ -21,8 +42,8 @@ def load_component_ids() -> set[str]:
             "Missing components-data.json. Run scripts/sync_components.py first."
         )
 
-    data = json.loads(data_path.read_text())
-    return {item["id"] for item in data}
+    data = parse_json(data_path.read_bytes())
+    return frozenset(item["id"] for item in data)
 
 
 def to_pascal(component_id: str) -> str:
@@ -33,15 +54,11 @@ def to_pascal(component_id: str) -> str:
 
 
 def parser_symbol(component_id: str, component_symbol: str) -> str:
-    if component_id == "weather-widget":
-        return "safeParseWeatherWidgetPayload"
-    return f"safeParseSerializable{component_symbol}"
+    return PARSER_OVERRIDES.get(component_id) or f"safeParseSerializable{component_symbol}"
 
 
 def schema_symbol(component_id: str, component_symbol: str) -> str:
-    if component_id == "weather-widget":
-        return "WeatherWidgetPayloadSchema"
-    return f"Serializable{component_symbol}Schema"
+    return SCHEMA_OVERRIDES.get(component_id) or f"Serializable{component_symbol}Schema"
 
 
 def render_backend(component_id: str, tool_name: str, component_symbol: str) -> str:
@@ -112,7 +129,7 @@ function ToolResultView({{ toolName, result }}: {{ toolName: string; result: unk
 '''
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Generate Tool UI wiring snippets")
     parser.add_argument(
         "--mode",
@@ -125,14 +142,14 @@ def main() -> None:
         "--tool-name",
         help="Tool name key used in your runtime (default: show<Component>)",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     component_id = args.component.strip().lower()
     known_ids = load_component_ids()
     if component_id not in known_ids:
         print(f"Unknown component id: {component_id}")
         print("Use scripts/tool_ui_components.py list to see valid ids.")
-        raise SystemExit(1)
+        return 1
 
     component_symbol = to_pascal(component_id)
     default_tool_name = f"show{component_symbol}"
@@ -145,6 +162,8 @@ def main() -> None:
     else:
         print(render_manual(component_id, tool_name, component_symbol))
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
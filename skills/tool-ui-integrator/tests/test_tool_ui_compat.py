@@ -1,11 +1,15 @@
 import json
+import os
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-SKILL_ROOT = Path(__file__).resolve().parents[1]
-SCRIPT = SKILL_ROOT / "scripts" / "tool_ui_compat.py"
+from script_helpers import SCRIPTS_DIR, load_script, run_in_process, run_subprocess
+
+SCRIPT = SCRIPTS_DIR / "tool_ui_compat.py"
+MODULE = load_script(SCRIPT)
 
 
 def write_json(path: Path, payload: dict) -> None:
@@ -13,14 +17,19 @@ def write_json(path: Path, payload: dict) -> None:
 
 
 class ToolUiCompatScriptTests(unittest.TestCase):
+    def setUp(self):
+        cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_home.cleanup)
+        self.cache_home = Path(cache_home.name)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home.name})
+        env.start()
+        self.addCleanup(env.stop)
+
     def run_script(self, project_dir: Path, *args: str) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
-            ["python3", str(SCRIPT), "--project", str(project_dir), *args],
-            cwd=SKILL_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        return run_in_process(MODULE, ["--project", str(project_dir), *args])
+
+    def run_cli(self, project_dir: Path, *args: str) -> subprocess.CompletedProcess[str]:
+        return run_subprocess(SCRIPT, ["--project", str(project_dir), *args])
 
     def test_basic_pass(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -91,6 +100,125 @@ class ToolUiCompatScriptTests(unittest.TestCase):
                 or "missing module paths for Tool UI imports" in result.stdout
             )
 
+    def test_doctor_resolves_extensionless_and_dotted_imports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app" / "styles").mkdir(parents=True)
+            (root / "app" / "styles" / "globals.css").write_text("/* ok */\n")
+            (root / "src").mkdir(parents=True)
+            (root / "src" / "page.tsx").write_text(
+                'import { Plan } from "@/components/tool-ui/plan";\n'
+                'import { config } from "@/components/tool-ui/chart.config";\n'
+            )
+            tool_ui_dir = root / "components" / "tool-ui"
+            (tool_ui_dir / "shared").mkdir(parents=True)
+            (tool_ui_dir / "plan").mkdir()
+            (tool_ui_dir / "plan" / "index.tsx").write_text("export {};\n")
+            (tool_ui_dir / "chart.config.ts").write_text("export {};\n")
+
+            write_json(
+                root / "components.json",
+                {
+                    "aliases": {"utils": "@/lib/utils", "components": "@/components"},
+                    "registries": {"@tool-ui": "https://tool-ui.com/r/{name}.json"},
+                    "tailwind": {"css": "app/styles/globals.css"},
+                },
+            )
+
+            result = self.run_script(root, "--doctor")
+            self.assertEqual(result.returncode, 0, result.stdout)
+            self.assertIn("resolved 2 Tool UI import paths", result.stdout)
+
+    def test_doctor_resolves_js_imports_of_ts_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app" / "styles").mkdir(parents=True)
+            (root / "app" / "styles" / "globals.css").write_text("/* ok */\n")
+            (root / "src").mkdir(parents=True)
+            (root / "src" / "page.tsx").write_text(
+                'import { Plan } from "@/components/tool-ui/plan.js";\n'
+            )
+            tool_ui_dir = root / "components" / "tool-ui"
+            (tool_ui_dir / "shared").mkdir(parents=True)
+            (tool_ui_dir / "plan.ts").write_text("export {};\n")
+
+            write_json(
+                root / "components.json",
+                {
+                    "aliases": {"utils": "@/lib/utils", "components": "@/components"},
+                    "registries": {"@tool-ui": "https://tool-ui.com/r/{name}.json"},
+                    "tailwind": {"css": "app/styles/globals.css"},
+                },
+            )
+
+            result = self.run_script(root, "--doctor")
+            self.assertEqual(result.returncode, 0, result.stdout)
+            self.assertIn("resolved 1 Tool UI import paths", result.stdout)
+
+    def test_doctor_scan_cache_picks_up_edited_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app" / "styles").mkdir(parents=True)
+            (root / "app" / "styles" / "globals.css").write_text("/* ok */\n")
+            (root / "src").mkdir(parents=True)
+            page = root / "src" / "page.tsx"
+            page.write_text('import { Plan } from "@/components/tool-ui/plan";\n')
+            tool_ui_dir = root / "components" / "tool-ui"
+            (tool_ui_dir / "shared").mkdir(parents=True)
+            (tool_ui_dir / "plan.tsx").write_text("export {};\n")
+
+            write_json(
+                root / "components.json",
+                {
+                    "aliases": {"utils": "@/lib/utils", "components": "@/components"},
+                    "registries": {"@tool-ui": "https://tool-ui.com/r/{name}.json"},
+                    "tailwind": {"css": "app/styles/globals.css"},
+                },
+            )
+
+            first = self.run_script(root, "--doctor")
+            self.assertEqual(first.returncode, 0, first.stdout)
+            self.assertTrue(list((self.cache_home / "tool-ui-compat").glob("*.json")))
+
+            page.write_text(
+                'import { Plan } from "@/components/tool-ui/plan";\n'
+                'import { Chart } from "@/components/tool-ui/chart";\n'
+            )
+            second = self.run_script(root, "--doctor")
+            self.assertNotEqual(second.returncode, 0)
+            self.assertIn("@/components/tool-ui/chart", second.stdout)
+
+    def test_doctor_ignores_malformed_scan_cache_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app" / "styles").mkdir(parents=True)
+            (root / "app" / "styles" / "globals.css").write_text("/* ok */\n")
+            (root / "src").mkdir(parents=True)
+            (root / "src" / "page.tsx").write_text(
+                'import { Chart } from "@/components/tool-ui/chart";\n'
+            )
+            (root / "components" / "tool-ui" / "shared").mkdir(parents=True)
+
+            write_json(
+                root / "components.json",
+                {
+                    "aliases": {"utils": "@/lib/utils", "components": "@/components"},
+                    "registries": {"@tool-ui": "https://tool-ui.com/r/{name}.json"},
+                    "tailwind": {"css": "app/styles/globals.css"},
+                },
+            )
+
+            self.run_script(root, "--doctor")
+            (cache_file,) = (self.cache_home / "tool-ui-compat").glob("*.json")
+            cache = json.loads(cache_file.read_text())
+            for entry in cache["files"].values():
+                entry[2] = ["oops"]
+            cache_file.write_text(json.dumps(cache))
+
+            result = self.run_script(root, "--doctor")
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("@/components/tool-ui/chart", result.stdout)
+
     def test_doctor_handles_assistant_import_scan(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -119,6 +247,12 @@ class ToolUiCompatScriptTests(unittest.TestCase):
             self.assertEqual(result.returncode, 0)
             self.assertIn("@assistant-ui/react package installed", result.stdout)
 
+    def test_cli_exits_nonzero_without_components_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = self.run_cli(Path(tmp))
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("components.json not found", result.stdout)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,20 +1,18 @@
 import subprocess
 import unittest
-from pathlib import Path
 
-SKILL_ROOT = Path(__file__).resolve().parents[1]
-SCRIPT = SKILL_ROOT / "scripts" / "tool_ui_components.py"
+from script_helpers import SCRIPTS_DIR, load_script, run_in_process, run_subprocess
+
+SCRIPT = SCRIPTS_DIR / "tool_ui_components.py"
+MODULE = load_script(SCRIPT)
 
 
 class ToolUiComponentsScriptTests(unittest.TestCase):
     def run_script(self, *args: str) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
-            ["python3", str(SCRIPT), *args],
-            cwd=SKILL_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        return run_in_process(MODULE, list(args))
+
+    def run_cli(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return run_subprocess(SCRIPT, list(args))
 
     def test_list_includes_plan(self):
         result = self.run_script("list")
@@ -48,6 +46,11 @@ class ToolUiComponentsScriptTests(unittest.TestCase):
         self.assertNotEqual(result.returncode, 0)
         self.assertIn("Unknown component IDs", result.stdout)
 
+    def test_cli_install_command(self):
+        result = self.run_cli("install", "plan")
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("https://tool-ui.com/r/plan.json", result.stdout)
+
 
 if __name__ == "__main__":
     unittest.main()
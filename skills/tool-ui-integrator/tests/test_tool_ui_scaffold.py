@@ -1,20 +1,18 @@
 import subprocess
 import unittest
-from pathlib import Path
 
-SKILL_ROOT = Path(__file__).resolve().parents[1]
-SCRIPT = SKILL_ROOT / "scripts" / "tool_ui_scaffold.py"
+from script_helpers import SCRIPTS_DIR, load_script, run_in_process, run_subprocess
+
+SCRIPT = SCRIPTS_DIR / "tool_ui_scaffold.py"
+MODULE = load_script(SCRIPT)
 
 
 class ToolUiScaffoldScriptTests(unittest.TestCase):
     def run_script(self, *args: str) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
-            ["python3", str(SCRIPT), *args],
-            cwd=SKILL_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        return run_in_process(MODULE, list(args))
+
+    def run_cli(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return run_subprocess(SCRIPT, list(args))
 
     def test_backend_plan_scaffold(self):
         result = self.run_script("--mode", "assistant-backend", "--component", "plan")
@@ -42,6 +40,11 @@ class ToolUiScaffoldScriptTests(unittest.TestCase):
         self.assertNotEqual(result.returncode, 0)
         self.assertIn("Unknown component id", result.stdout)
 
+    def test_cli_invalid_component_exits_nonzero(self):
+        result = self.run_cli("--mode", "manual", "--component", "nope")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Unknown component id", result.stdout)
+
 
 if __name__ == "__main__":
     unittest.main()
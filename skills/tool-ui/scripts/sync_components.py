@@ -14,6 +14,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
 
 CATEGORY_LABELS = {
@@ -111,7 +112,7 @@ def default_source_path() -> Path:
     return script_path.parents[4] / "lib" / "docs" / "component-registry.ts"
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> int:
     skill_root = Path(__file__).resolve().parents[1]
 
     parser = argparse.ArgumentParser(description="Sync Tool UI skill component metadata")
@@ -130,11 +131,12 @@ def main() -> None:
         default=str(skill_root / "references" / "components-catalog.md"),
         help="Output markdown catalog",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     source_path = Path(args.source).resolve()
     if not source_path.exists():
-        raise SystemExit(f"Source file not found: {source_path}")
+        print(f"Source file not found: {source_path}", file=sys.stderr)
+        return 1
 
     components = parse_registry(source_path)
     write_outputs(components, Path(args.data_out).resolve(), Path(args.catalog_out).resolve())
@@ -142,7 +144,8 @@ def main() -> None:
     print(f"Synced {len(components)} components")
     print(f"- {Path(args.data_out).resolve()}")
     print(f"- {Path(args.catalog_out).resolve()}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -4,12 +4,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import signal
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 REGISTRY_BASE = "https://tool-ui.com/r"
 DOCS_BASE = "https://tool-ui.com/docs"
 
@@ -20,14 +27,29 @@ BUNDLES: dict[str, list[str]] = {
 }
 
 
-@dataclass(frozen=True)
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True, slots=True)
 class Component:
     id: str
     label: str
     category: str
     description: str
+    hay_tokens: frozenset[str] = field(default=frozenset(), compare=False, repr=False)
+
+
+def tokenize(value: str) -> frozenset[str]:
+    return frozenset(NON_ALNUM_RE.sub(" ", value.lower()).split())
 
 
+def parse_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.cache
 def load_components() -> list[Component]:
     skill_root = Path(__file__).resolve().parents[1]
     data_path = skill_root / "references" / "components-data.json"
@@ -36,13 +58,16 @@ def load_components() -> list[Component]:
             "Missing components-data.json. Run scripts/sync_components.py first."
         )
 
-    raw = json.loads(data_path.read_text())
+    raw = parse_json(data_path.read_bytes())
     components = [
         Component(
             id=item["id"],
             label=item["label"],
             category=item["category"],
             description=item["description"],
+            hay_tokens=tokenize(
+                " ".join([item["id"], item["label"], item["category"], item["description"]])
+            ),
         )
         for item in raw
     ]
@@ -50,12 +75,25 @@ def load_components() -> list[Component]:
     return components
 
 
-COMPONENTS = load_components()
-BY_ID = {c.id: c for c in COMPONENTS}
+def build_token_index(
+    components: list[Component],
+) -> tuple[dict[str, set[int]], dict[str, set[int]]]:
+    # prefix_index: every prefix of every hay token -> component indices.
+    # token_index: every whole hay token -> component indices.
+    prefix_index: dict[str, set[int]] = {}
+    token_index: dict[str, set[int]] = {}
+    for index, comp in enumerate(components):
+        for hay_token in comp.hay_tokens:
+            token_index.setdefault(hay_token, set()).add(index)
+            for end in range(1, len(hay_token) + 1):
+                prefix_index.setdefault(hay_token[:end], set()).add(index)
 
+    return prefix_index, token_index
 
-def tokenize(value: str) -> set[str]:
-    return set(re.findall(r"[a-z0-9]+", value.lower()))
+
+COMPONENTS = load_components()
+BY_ID = {c.id: c for c in COMPONENTS}
+PREFIX_INDEX, TOKEN_INDEX = build_token_index(COMPONENTS)
 
 
 def search(query: str) -> list[Component]:
@@ -63,24 +101,17 @@ def search(query: str) -> list[Component]:
     if not tokens:
         return COMPONENTS
 
-    scored: list[tuple[int, Component]] = []
-    for comp in COMPONENTS:
-        haystack = " ".join([comp.id, comp.label, comp.category, comp.description]).lower()
-        hay_tokens = tokenize(haystack)
-        score = 0
-        for token in tokens:
-            if any(
-                token == hay_token
-                or hay_token.startswith(token)
-                or token.startswith(hay_token)
-                for hay_token in hay_tokens
-            ):
-                score += 1
-        if score > 0:
-            scored.append((score, comp))
-
-    scored.sort(key=lambda item: (-item[0], item[1].id))
-    return [comp for _, comp in scored]
+    scores: Counter[int] = Counter()
+    for token in tokens:
+        # Hay tokens the query token is a prefix of (or equal to)...
+        hits = set(PREFIX_INDEX.get(token, ()))
+        # ...plus hay tokens that are a proper prefix of the query token.
+        for end in range(1, len(token)):
+            hits.update(TOKEN_INDEX.get(token[:end], ()))
+        scores.update(hits)
+
+    ranked = sorted(scores, key=lambda index: (-scores[index], COMPONENTS[index].id))
+    return [COMPONENTS[index] for index in ranked]
 
 
 def normalize_ids(component_ids: list[str]) -> list[str]:
@@ -148,9 +179,7 @@ def bundle_command(name: str | None) -> None:
     print_install(members)
 
 
-def main() -> None:
-    signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Tool UI component helper")
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -168,7 +197,7 @@ def main() -> None:
     bundle_p = sub.add_parser("bundle", help="List or print install command for bundle recipes")
     bundle_p.add_argument("name", nargs="?", help="Bundle name (omit to list available bundles)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "list":
         list_components()
@@ -181,6 +210,9 @@ def main() -> None:
     elif args.command == "bundle":
         bundle_command(args.name)
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    raise SystemExit(main())